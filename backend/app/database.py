@@ -1,11 +1,15 @@
 import os
+import logging
 from motor.motor_asyncio import AsyncIOMotorClient
 from dotenv import load_dotenv
-from pymongo import ASCENDING, IndexModel
+from pymongo import ASCENDING, DESCENDING, IndexModel
+from pymongo.errors import DuplicateKeyError
 
 # Load environment variables from .env file
 load_dotenv()
 
+logger = logging.getLogger("app.startup")
+
 # --- Database Connection ---
 MONGO_DETAILS = os.getenv("MONGODB_URL", "mongodb://localhost:27017")
 DATABASE_NAME = os.getenv("DATABASE_NAME", "temple_db")
@@ -54,5 +58,18 @@ async def ensure_indexes():
     # Audit indexes
     await calendar_audit_collection.create_index([("dateISO", ASCENDING), ("timestamp", ASCENDING)], name="audit_date_time")
 
+    # Activity log: always sorted newest first, optionally filtered by username/role
+    await activities_collection.create_index([("timestamp", DESCENDING)], name="activity_time")
+    await activities_collection.create_index([("username", ASCENDING), ("timestamp", DESCENDING)], name="activity_user_time")
+    await activities_collection.create_index([("role", ASCENDING), ("timestamp", DESCENDING)], name="activity_role_time")
+
+    # Roles are seeded by upserting on role_id. Created last: databases seeded by the
+    # old count-then-insert_many code may hold duplicate roles, and a failure here
+    # must not skip the indexes above.
+    try:
+        await roles_collection.create_index([("role_id", ASCENDING)], unique=True, name="uniq_role_id")
+    except DuplicateKeyError as e:
+        logger.error(f"Could not create unique role_id index; remove duplicate role documents first: {e}")
+
 # Note: The index creation is now within an async function.
 # This should be called during your application's startup event in main.py.
@@ -1,5 +1,9 @@
 import os
+import sys
+import queue
 import random
+import logging
+import logging.handlers
 from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
 from .routers import rituals, bookings, events, admin, gallery, stock, roles, profile, activity, employee_booking, gallery_layout, slideshow, featured_event, committee, gallery_home_preview, calendar, auth  # changed: employee_bookings -> employee_booking
@@ -11,11 +15,27 @@ from .models.ritual_models import AvailableRitualBase
 from fastapi.middleware.cors import CORSMiddleware
 from .middleware.jwt_auth_middleware import JWTAuthMiddleware
 from dotenv import load_dotenv
-from pymongo import ASCENDING
+from pymongo import UpdateOne
 
 # Load environment variables from .env file at the very beginning
 load_dotenv()
 
+# --- Filesystem Paths ---
+# Resolved once at import; the backend root doubles as the /static directory.
+_BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+_PROFILE_DIR = os.path.join(_BASE_DIR, "profile")
+
+# --- Startup Logging ---
+# Records are handed to a queue and written to stdout by a listener thread,
+# so startup logging never blocks the event loop on terminal/pipe I/O.
+logger = logging.getLogger("app.startup")
+logger.setLevel(logging.INFO)
+logger.propagate = False
+_log_queue = queue.Queue(-1)
+_log_listener = logging.handlers.QueueListener(_log_queue, logging.StreamHandler(sys.stdout))
+logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+_log_listener.start()
+
 # --- App Initialization ---
 app = FastAPI(
     title="Temple Management System API",
@@ -68,18 +88,23 @@ default_origin_regex = r"^https:\/\/([a-z0-9-]+\.)*netlify\.app$"
 allow_origin_regex = origin_regex_env or default_origin_regex
 
 # Log resolved CORS configuration at startup for debugging
-print(f"CORS allow_origins: {origins}")
+logger.info(f"CORS allow_origins: {origins}")
 if allow_origin_regex:
-    print(f"CORS allow_origin_regex: {allow_origin_regex}")
+    logger.info(f"CORS allow_origin_regex: {allow_origin_regex}")
+
+# How long browsers may cache a preflight response (seconds). Without it every
+# cross-origin POST/PUT/DELETE is preceded by an OPTIONS round trip.
+cors_max_age = int(os.getenv("CORS_MAX_AGE", 600))
 
 app.add_middleware(
     CORSMiddleware,
     allow_origins=origins,
     allow_origin_regex=allow_origin_regex,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"],
+    allow_headers=["Authorization", "Content-Type", "X-Requested-With"],
     expose_headers=["content-length", "content-type"],
+    max_age=cors_max_age,
 )
 
 
@@ -89,14 +114,14 @@ async def startup_db_client():
     # --- Ensure Unique Indexes ---
     try:
         await ensure_indexes()
-        print("Ensured required indexes (admins, calendar)")
+        logger.info("Ensured required indexes (admins, roles, calendar)")
     except Exception as e:
         # Will fail if duplicates exist; surface a warning so it can be resolved
-        print(f"Warning: Could not ensure indexes: {e}")
+        logger.warning(f"Could not ensure indexes: {e}")
 
     # --- Populate Rituals ---
     if await available_rituals_collection.count_documents({}) == 0:
-        print("Populating database with initial rituals...")
+        logger.info("Populating database with initial rituals...")
         initial_rituals = [
             AvailableRitualBase(name='Aarti & Prayers', description='Traditional evening prayers with sacred flames.', price=101, duration='30 mins', popular=True, icon_name='Flame'),
             AvailableRitualBase(name='Puja & Offering', description='Personal worship ceremony with flowers and fruits.', price=251, duration='45 mins', popular=False, icon_name='Flower2'),
@@ -104,28 +129,36 @@ async def startup_db_client():
             AvailableRitualBase(name='Festival Ceremony', description='Grand rituals for special occasions.', price=1001, duration='2 hours', popular=False, icon_name='Star'),
         ]
         # You would typically insert these into the database.
-        # For example: await available_rituals_collection.insert_many([r.model_dump() for r in initial_rituals])
-        print("Database populated with initial rituals.")
+        # For example (one round trip, idempotent across workers):
+        # await available_rituals_collection.bulk_write(
+        #     [UpdateOne({"name": r.name}, {"$setOnInsert": r.model_dump()}, upsert=True) for r in initial_rituals],
+        #     ordered=False,
+        # )
+        logger.info("Database populated with initial rituals.")
 
     # --- Populate Roles ---
-    if await roles_collection.count_documents({}) == 0:
-        print("Populating roles collection with predefined roles...")
-        predefined_roles = [
-            RoleBase(role_id=0, role_name='Super Admin', basic_permissions=['*']),
-            RoleBase(role_id=1, role_name='Admin', basic_permissions=['departments.manage', 'users.manage', 'approvals.manage']),
-            RoleBase(role_id=2, role_name='Privileged User', basic_permissions=['staff.extended']),
-            RoleBase(role_id=3, role_name='Editor', basic_permissions=['content.create', 'content.update', 'events.manage']),
-            RoleBase(role_id=4, role_name='Employee', basic_permissions=['staff.basic']),
-            RoleBase(role_id=5, role_name='Viewer', basic_permissions=['read.only']),
-            RoleBase(role_id=6, role_name='Volunteer Coordinator', basic_permissions=['volunteers.manage']),
-            RoleBase(role_id=7, role_name='Support / Helpdesk', basic_permissions=['support.assist']),
-        ]
-        await roles_collection.insert_many([r.model_dump() for r in predefined_roles])
-        print("Roles collection populated.")
+    # Upsert the predefined roles by role_id in a single unordered bulk write.
+    # Existing roles are left untouched; only missing ones are inserted.
+    predefined_roles = [
+        RoleBase(role_id=0, role_name='Super Admin', basic_permissions=['*']),
+        RoleBase(role_id=1, role_name='Admin', basic_permissions=['departments.manage', 'users.manage', 'approvals.manage']),
+        RoleBase(role_id=2, role_name='Privileged User', basic_permissions=['staff.extended']),
+        RoleBase(role_id=3, role_name='Editor', basic_permissions=['content.create', 'content.update', 'events.manage']),
+        RoleBase(role_id=4, role_name='Employee', basic_permissions=['staff.basic']),
+        RoleBase(role_id=5, role_name='Viewer', basic_permissions=['read.only']),
+        RoleBase(role_id=6, role_name='Volunteer Coordinator', basic_permissions=['volunteers.manage']),
+        RoleBase(role_id=7, role_name='Support / Helpdesk', basic_permissions=['support.assist']),
+    ]
+    roles_result = await roles_collection.bulk_write(
+        [UpdateOne({"role_id": r.role_id}, {"$setOnInsert": r.model_dump()}, upsert=True) for r in predefined_roles],
+        ordered=False,
+    )
+    if roles_result.upserted_count:
+        logger.info(f"Roles collection populated with {roles_result.upserted_count} predefined roles.")
 
     # --- Create Default Admin User from .env ---
     if await admins_collection.count_documents({}) == 0:
-        print("Creating default admin user from .env file...")
+        logger.info("Creating default admin user from .env file...")
         admin_username = os.getenv("DEFAULT_ADMIN_USERNAME", "admin")
         admin_password = os.getenv("DEFAULT_ADMIN_PASSWORD")
         admin_name = os.getenv("DEFAULT_ADMIN_NAME", "Administrator")
@@ -147,7 +180,7 @@ async def startup_db_client():
             hashed_password=hashed_password,
             role=role_name,
             role_id=0,
-            mobile_number=int(''.join([str(random.randint(0, 9)) for _ in range(10)])),
+            mobile_number=random.randrange(10**9, 10**10),
             mobile_prefix="+91",
             profile_picture="https://example.com/default-avatar.png",
             dob="1970-01-01",
@@ -158,37 +191,50 @@ async def startup_db_client():
         )
         # Use the create_admin function from the auth_service
         await auth_service.create_admin(admin_user)
-        print(f"Default admin created with username '{admin_username}'.")
-        print("Password is set from the DEFAULT_ADMIN_PASSWORD in your .env file.")
+        logger.info(f"Default admin created with username '{admin_username}'.")
+        logger.info("Password is set from the DEFAULT_ADMIN_PASSWORD in your .env file.")
 
 
 # --- API Routers ---
-app.include_router(admin.router, tags=["Admin"], prefix="/api/admin")
-app.include_router(rituals.router, tags=["Rituals"], prefix="/api/rituals")
-app.include_router(events.router, tags=["Events"], prefix="/api/events")
-app.include_router(bookings.router, tags=["Bookings"], prefix="/api/bookings")
-app.include_router(employee_booking.router, tags=["Employee Bookings"], prefix="/api/employee-bookings")  # changed module name
-app.include_router(gallery.router, tags=["Gallery"], prefix="/api/gallery")
-app.include_router(gallery_layout.router, tags=["Gallery Layout"], prefix="/api/gallery-layout")
-app.include_router(gallery_home_preview.router, tags=["Gallery Home Preview"], prefix="/api/gallery-home-preview")
-app.include_router(committee.router, tags=["Committee"], prefix="/api/committee")
-app.include_router(stock.router, tags=["Stock"], prefix="/api/stock")
-app.include_router(roles.router, tags=["Roles"], prefix="/api/roles")
-app.include_router(profile.router, tags=["Profile"], prefix="/api/profile") 
-app.include_router(activity.router, tags=["Activity"], prefix="/api/activity")
-app.include_router(slideshow.router, tags=["Slideshow"], prefix="/api/slideshow")
-app.include_router(featured_event.router, tags=["Featured Event"], prefix="/api/featured-event")
-app.include_router(calendar.router, tags=["Calendar"], prefix="/api")
-app.include_router(auth.router, tags=["Authentication"], prefix="/api/auth")
+# (router, tag, prefix) registration table
+_ROUTERS = (
+    (admin.router, "Admin", "/api/admin"),
+    (rituals.router, "Rituals", "/api/rituals"),
+    (events.router, "Events", "/api/events"),
+    (bookings.router, "Bookings", "/api/bookings"),
+    (employee_booking.router, "Employee Bookings", "/api/employee-bookings"),  # changed module name
+    (gallery.router, "Gallery", "/api/gallery"),
+    (gallery_layout.router, "Gallery Layout", "/api/gallery-layout"),
+    (gallery_home_preview.router, "Gallery Home Preview", "/api/gallery-home-preview"),
+    (committee.router, "Committee", "/api/committee"),
+    (stock.router, "Stock", "/api/stock"),
+    (roles.router, "Roles", "/api/roles"),
+    (profile.router, "Profile", "/api/profile"),
+    (activity.router, "Activity", "/api/activity"),
+    (slideshow.router, "Slideshow", "/api/slideshow"),
+    (featured_event.router, "Featured Event", "/api/featured-event"),
+    (calendar.router, "Calendar", "/api"),
+    (auth.router, "Authentication", "/api/auth"),
+)
+for _router, _tag, _prefix in _ROUTERS:
+    app.include_router(_router, tags=[_tag], prefix=_prefix)
 
 # Serve static files for profile pictures under /static/
-_base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
-_profile_dir = os.path.join(_base_dir, "profile")
-try:
-    os.makedirs(_profile_dir, exist_ok=True)
-except Exception:
-    pass
-app.mount("/static", StaticFiles(directory=_base_dir), name="static")
+# Set SERVE_STATIC=false when a reverse proxy/CDN serves /static directly.
+serve_static = os.getenv("SERVE_STATIC", "true").lower() in {"1", "true", "yes"}
+if serve_static:
+    if not os.path.isdir(_PROFILE_DIR):
+        try:
+            os.makedirs(_PROFILE_DIR, exist_ok=True)
+        except Exception:
+            pass
+    # The directory is resolved above, so skip StaticFiles' own existence check
+    app.mount("/static", StaticFiles(directory=_BASE_DIR, check_dir=False), name="static")
+
+@app.on_event("shutdown")
+async def stop_log_listener():
+    # Flush any queued log records before the process exits
+    _log_listener.stop()
 
 @app.get("/")
 async def health_check():
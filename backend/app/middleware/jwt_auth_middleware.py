@@ -1,108 +1,148 @@
+import os
 import logging
+import orjson
 from fastapi import Request, HTTPException
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.responses import Response
+from starlette.types import ASGIApp, Receive, Scope, Send
 from ..services.jwt_security_service import jwt_security
 
 # Configure logging for security events
 logger = logging.getLogger("jwt_security")
 logger.setLevel(logging.INFO)
 
-class JWTAuthMiddleware(BaseHTTPMiddleware):
-    def __init__(self, app, exclude_paths: list = None):
-        super().__init__(app)
+# Per-request info logs (preflight, exclusions, API access). Set JWT_REQUEST_LOGGING=false
+# to skip building them entirely; security warnings/errors are always logged.
+_REQUEST_LOGGING = os.getenv("JWT_REQUEST_LOGGING", "true").lower() in {"1", "true", "yes"}
+
+class JWTAuthMiddleware:
+    """Pure ASGI middleware (no BaseHTTPMiddleware task group / body stream per request).
+
+    Pass-through paths are decided from the raw scope with a single
+    str.startswith call per prefix tuple; a Request is only built when a token
+    actually has to be checked.
+    """
+
+    def __init__(self, app: ASGIApp, exclude_paths: list = None):
+        self.app = app
         # Paths that don't require JWT authentication
-        self.exclude_paths = exclude_paths or [
+        # Kept as a tuple so str.startswith can check every prefix in one call
+        self.exclude_paths = tuple(exclude_paths or [
             "/docs", "/redoc", "/openapi.json", "/", 
             "/api/auth/login", "/api/auth/register", "/api/auth/get-token", 
             "/api/auth/refresh-token", "/api"
-        ]
+        ])
         # Public GET endpoints (no auth required)
         # Use exact matches for sensitive roots and prefix matches where safe
-        self.public_get_exact = {
+        self.public_get_exact = frozenset({
             "/api/featured-event",
             "/api/featured-event/",
             "/api/rituals",
             "/api/rituals/",
-        }
-        self.public_get_prefixes = [
+        })
+        self.public_get_prefixes = (
             "/api/events/",                 # list and view event by id, also files
             "/api/gallery/",                # list and files
             "/api/gallery-home-preview",    # fetch home preview
             "/api/slideshow",               # fetch slideshow
             "/api/v1/calendar/",            # calendar APIs (GET)
-        ]
+        )
+        # Fixed-content error bodies are serialized once instead of per rejection
+        self._missing_token_body = orjson.dumps({
+            "detail": "Authentication required",
+            "error_code": "MISSING_TOKEN"
+        })
+        self._auth_error_body = orjson.dumps({
+            "detail": "Authentication error",
+            "error_code": "AUTH_ERROR"
+        })
     
-    async def dispatch(self, request: Request, call_next):
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        path = scope["path"]
+        method = scope["method"]
+
         # Skip validation for CORS preflight requests
-        if request.method == "OPTIONS":
-            logger.info(f"OPTIONS request for {request.url.path} - passing through JWT middleware")
-            return await call_next(request)
-            
+        if method == "OPTIONS":
+            if _REQUEST_LOGGING:
+                logger.info(f"OPTIONS request for {path} - passing through JWT middleware")
+            return await self.app(scope, receive, send)
+
+        # Skip validation for non-API paths (static files, docs, etc.) before
+        # any other checks so they never pay for the exclusion scan
+        if not path.startswith("/api/"):
+            return await self.app(scope, receive, send)
+
         # Skip validation for excluded paths
-        if any(request.url.path.startswith(path) for path in self.exclude_paths):
-            logger.info(f"Excluding {request.url.path} from JWT validation (matched exclusion path)")
-            return await call_next(request)
-        
-        # Skip validation for non-API paths (static files, etc.)
-        if not request.url.path.startswith("/api/"):
-            return await call_next(request)
+        if path.startswith(self.exclude_paths):
+            if _REQUEST_LOGGING:
+                logger.info(f"Excluding {path} from JWT validation (matched exclusion path)")
+            return await self.app(scope, receive, send)
 
         # Allow public GET endpoints
-        if request.method == "GET":
-            path = request.url.path
+        if method == "GET":
             if path in self.public_get_exact:
-                return await call_next(request)
-            if any(path.startswith(prefix) for prefix in self.public_get_prefixes):
+                return await self.app(scope, receive, send)
+            if path.startswith(self.public_get_prefixes):
                 # But keep admin-only subpaths protected if any
                 # Example: do not allow /api/rituals/admin (not covered by prefixes anyway)
-                return await call_next(request)
-        
+                return await self.app(scope, receive, send)
+
+        request = Request(scope)
+
         # Log the request for monitoring
         client_ip = request.client.host if request.client else "unknown"
-        origin = request.headers.get("origin", "unknown")
-        logger.info(f"API request: {request.method} {request.url.path} from IP {client_ip}, Origin: {origin}")
-        
+        if _REQUEST_LOGGING:
+            origin = request.headers.get("origin", "unknown")
+            logger.info(f"API request: {method} {path} from IP {client_ip}, Origin: {origin}")
+
+        response = await self._authenticate(request, method, path, client_ip)
+        if response is not None:
+            return await response(scope, receive, send)
+
+        # Continue with the request
+        await self.app(scope, receive, send)
+
+    async def _authenticate(self, request: Request, method: str, path: str, client_ip: str):
+        """Verify the request's token and store its payload on request.state.user.
+
+        Returns an error response to send instead of the request, or None if authenticated.
+        """
         try:
             # Extract token from Authorization header or cookie
             token = None
             auth_header = request.headers.get("Authorization")
             
-            if auth_header and auth_header.startswith("Bearer "):
-                token = auth_header.split(" ")[1]
+            # Slice off the scheme instead of split() to avoid a list allocation
+            if auth_header is not None and len(auth_header) > 7 and auth_header[:7] == "Bearer ":
+                token = auth_header[7:]
             else:
                 # Try to get token from HTTP-only cookie as fallback
                 token = request.cookies.get("access_token")
             
             if not token:
-                logger.warning(f"Missing token for {request.method} {request.url.path} from IP {client_ip}")
-                return JSONResponse(
-                    status_code=401,
-                    content={
-                        "detail": "Authentication required",
-                        "error_code": "MISSING_TOKEN"
-                    }
-                )
+                logger.warning(f"Missing token for {method} {path} from IP {client_ip}")
+                return Response(self._missing_token_body, status_code=401, media_type="application/json")
             
-            # Get client info for token binding
-            client_info = jwt_security.get_client_info(request)
+            # Client info is only needed for token binding; skip the header parsing
+            # on the common path where binding is disabled. Handlers that need it
+            # call jwt_security.get_client_info(request) themselves.
+            client_info = jwt_security.get_client_info(request) if jwt_security.bind_to_client else None
             
             # Verify token
             payload = jwt_security.verify_token(token, token_type="access", client_info=client_info)
             
-            # Add user info to request state
+            # Add user info to request state (backed by scope["state"], so route
+            # handlers see it on their own Request object)
             request.state.user = payload
-            request.state.client_info = client_info
-            
-            # Continue with the request
-            response = await call_next(request)
-            return response
+            return None
             
         except HTTPException as e:
             # Log security violation for monitoring
             logger.warning(
-                f"JWT security violation: {request.method} {request.url.path} "
+                f"JWT security violation: {method} {path} "
                 f"from IP {client_ip}, Error: {e.detail}"
             )
             
@@ -118,10 +158,4 @@ class JWTAuthMiddleware(BaseHTTPMiddleware):
             # Log the error for debugging (but don't expose details)
             logger.error(f"JWT middleware error: {str(e)}")
             
-            return JSONResponse(
-                status_code=500,
-                content={
-                    "detail": "Authentication error",
-                    "error_code": "AUTH_ERROR"
-                }
-            )
\ No newline at end of file
+            return Response(self._auth_error_body, status_code=500, media_type="application/json")
\ No newline at end of file
@@ -4,4 +4,4 @@ from .committee_models import CommitteeMemberBase, CommitteeMemberCreate, Commit
 from .event_models import EventBase, EventCreate, EventInDB
 from .gallery_models import GalleryImageBase, GalleryImageCreate, GalleryImageInDB
 from .ritual_models import AvailableRitualBase, AvailableRitualCreate, AvailableRitualInDB, RitualInstance
-from .main_models import PyObjectId
+from .main_models import IdField, PyObjectId
@@ -1,8 +1,7 @@
 from pydantic import BaseModel, Field, ConfigDict
 from typing import Optional
 from datetime import datetime
-from bson import ObjectId
-from .main_models import PyObjectId
+from .main_models import IdField
 
 class ActivityBase(BaseModel):
     username: str = Field(..., example="admin")
@@ -14,5 +13,5 @@ class ActivityCreate(ActivityBase):
     pass
 
 class ActivityInDB(ActivityBase):
-    id: PyObjectId = Field(default_factory=PyObjectId, alias="_id")
-    model_config = ConfigDict(populate_by_name=True, from_attributes=True, json_encoders={ObjectId: str})
\ No newline at end of file
+    id: IdField
+    model_config = ConfigDict(populate_by_name=True, from_attributes=True, frozen=True)
\ No newline at end of file
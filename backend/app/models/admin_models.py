@@ -1,7 +1,6 @@
 from pydantic import BaseModel, Field, ConfigDict, EmailStr
-from typing import Optional, List
-from bson import ObjectId
-from .main_models import PyObjectId
+from typing import Optional
+from .main_models import IdField, OptStrList, StrList
 from datetime import datetime
 
 # --- Schemas for Admin Authentication ---
@@ -17,15 +16,15 @@ class AdminBase(BaseModel):
     profile_picture: Optional[str] = Field(None, example="https://example.com/profile.jpg")
     dob: Optional[str] = Field(None, example="1990-01-01")
     last_login: Optional[datetime] = Field(None)
-    permissions: List[str] = Field(default_factory=list)
+    permissions: StrList
     created_at: datetime = Field(default_factory=datetime.utcnow)
     created_by: str = Field(..., example="system")
     updated_at: Optional[datetime] = Field(None)
     updated_by: Optional[str] = Field(None)
     # Tracks the last time a user updated their profile picture (for cooldown enforcement)
     last_profile_update: Optional[datetime] = Field(None)
-    notification_preference: List[str] = Field(default_factory=list)
-    notification_list: Optional[List[str]] = Field(None)
+    notification_preference: StrList
+    notification_list: OptStrList
     isRestricted: bool = Field(False)
 
 # Used when creating a new admin, includes the hashed password.
@@ -44,23 +43,23 @@ class AdminUpdate(BaseModel):
     profile_picture: Optional[str] = None
     dob: Optional[str] = None
     last_login: Optional[datetime] = None
-    permissions: Optional[List[str]] = None
-    notification_preference: Optional[List[str]] = None
-    notification_list: Optional[List[str]] = None
+    permissions: OptStrList
+    notification_preference: OptStrList
+    notification_list: OptStrList
     isRestricted: Optional[bool] = None
     # If provided, this will be hashed by the service layer
     hashed_password: Optional[str] = None
 
 # Represents an admin object as stored in the database.
 class AdminInDB(AdminBase):
-    id: PyObjectId = Field(default_factory=PyObjectId, alias="_id")
+    id: IdField
     hashed_password: str
-    model_config = ConfigDict(populate_by_name=True, from_attributes=True, json_encoders={ObjectId: str})
+    model_config = ConfigDict(populate_by_name=True, from_attributes=True, frozen=True)
 
 # Public-safe model to return to clients (no hashed_password)
 class AdminPublic(AdminBase):
-    id: PyObjectId = Field(default_factory=PyObjectId, alias="_id")
-    model_config = ConfigDict(populate_by_name=True, from_attributes=True, json_encoders={ObjectId: str})
+    id: IdField
+    model_config = ConfigDict(populate_by_name=True, from_attributes=True, frozen=True)
 
 # Input model for creating admins from clients; server sets created_by/created_at
 class AdminCreateInput(BaseModel):
@@ -71,15 +70,20 @@ class AdminCreateInput(BaseModel):
     role_id: int
     mobile_number: int
     mobile_prefix: str
-    permissions: List[str] = Field(default_factory=list)
+    permissions: StrList
     isRestricted: bool = False
     hashed_password: str
 
 # Schema for the authentication token response.
 class Token(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     access_token: str
     token_type: str
 
 # Schema for the data embedded within the JWT.
 class TokenData(BaseModel):
+    # Not bound to any route; build the validator only on first use
+    model_config = ConfigDict(defer_build=True)
+
     username: Optional[str] = None
@@ -1,9 +1,13 @@
 from typing import Optional, Dict, Any, List, Union
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from datetime import datetime, date
 
 
+# CalendarDayBase, CalendarDayCreate and CalendarAuditEntry describe stored documents
+# but are not bound to any route, so their validators are only built on first use.
 class CalendarDayBase(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     dateISO: str = Field(..., description="YYYY-MM-DD")
     year: int
     month: int
@@ -30,6 +34,8 @@ class CalendarDayBase(BaseModel):
 
 
 class CalendarDayCreate(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     dateISO: str
     malayalam_year: Optional[Union[int, str]] = None
     naal: Optional[str] = Field(default=None, max_length=256)
@@ -53,7 +59,10 @@ class AssignMalayalamYearRangeRequest(BaseModel):
     dryRun: bool = False
 
 
+# Response-only shapes: built once per request and never modified
 class CalendarDayPublic(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     dateISO: str
     year: int
     month: int
@@ -69,11 +78,15 @@ class CalendarDayPublic(BaseModel):
 
 
 class MonthResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     days: List[CalendarDayPublic]
     lastModified: datetime
 
 
 class CalendarAuditEntry(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     dateISO: str
     op: str
     before: Optional[Dict[str, Any]]
@@ -1,7 +1,6 @@
 from pydantic import BaseModel, Field, ConfigDict
 from typing import Optional
-from bson import ObjectId
-from .main_models import PyObjectId
+from .main_models import IdField
 
 # --- Schema for Committee Members ---
 class CommitteeMemberBase(BaseModel):
@@ -22,5 +21,5 @@ class CommitteeMemberCreate(CommitteeMemberBase):
     pass
 
 class CommitteeMemberInDB(CommitteeMemberBase):
-    id: PyObjectId = Field(default_factory=PyObjectId, alias="_id")
-    model_config = ConfigDict(populate_by_name=True, from_attributes=True, json_encoders={ObjectId: str})
\ No newline at end of file
+    id: IdField
+    model_config = ConfigDict(populate_by_name=True, from_attributes=True, frozen=True)
\ No newline at end of file
@@ -1,17 +1,26 @@
-from pydantic import BaseModel, Field, ConfigDict
-from bson import ObjectId
-from .main_models import PyObjectId
+from pydantic import BaseModel, ConfigDict
+from .main_models import IdField
 
 # --- Schema for Events ---
 # Defines the base structure for an event.
 class EventBase(BaseModel):
-    title: str = Field(..., example="Diwali Celebration")
-    date: str = Field(..., example="2024-11-12")
-    time: str = Field(..., example="6:00 PM")
-    location: str = Field(..., example="Main Temple Hall")
-    description: str = Field(...)
+    # One class-level example instead of per-field example= kwargs
+    model_config = ConfigDict(json_schema_extra={"examples": [{
+        "title": "Diwali Celebration",
+        "date": "2024-11-12",
+        "time": "6:00 PM",
+        "location": "Main Temple Hall",
+        "description": "Festival of lights celebration",
+        "image": "/api/events/files/2025-01-01_12-00-00_000000/banner.jpg",
+    }]})
+
+    title: str
+    date: str
+    time: str
+    location: str
+    description: str
     # Image will be a backend-served URL (e.g., /api/events/files/<object_path>)
-    image: str = Field(..., example="/api/events/files/2025-01-01_12-00-00_000000/banner.jpg")
+    image: str
 
 # Used when creating a new event.
 class EventCreate(EventBase):
@@ -19,5 +28,5 @@ class EventCreate(EventBase):
 
 # Represents an event object as stored in the database.
 class EventInDB(EventBase):
-    id: PyObjectId = Field(default_factory=PyObjectId, alias="_id")
-    model_config = ConfigDict(populate_by_name=True, from_attributes=True, json_encoders={ObjectId: str})
+    id: IdField
+    model_config = ConfigDict(populate_by_name=True, from_attributes=True, frozen=True)
@@ -1,12 +1,15 @@
-from pydantic import BaseModel, Field, ConfigDict
-from typing import List, Optional
-from bson import ObjectId
-from .main_models import PyObjectId
+from pydantic import BaseModel, ConfigDict
+from typing import Optional, Tuple
+from .main_models import IdField
+
+# Shared default for an unset preview; tuples are immutable so every instance can reuse it
+_EMPTY_SLOTS = (None,) * 6
 
 
 class HomePreviewBase(BaseModel):
-    # Exactly six slots; nulls allowed to indicate empty
-    slots: List[Optional[str]] = Field(default_factory=lambda: [None, None, None, None, None, None], min_items=6, max_items=6)
+    # Exactly six slots; nulls allowed to indicate empty. A fixed-length tuple
+    # validates each position directly instead of checking a list's bounds.
+    slots: Tuple[Optional[str], Optional[str], Optional[str], Optional[str], Optional[str], Optional[str]] = _EMPTY_SLOTS
 
 
 class HomePreviewCreate(HomePreviewBase):
@@ -14,5 +17,5 @@ class HomePreviewCreate(HomePreviewBase):
 
 
 class HomePreviewInDB(HomePreviewBase):
-    id: PyObjectId = Field(default_factory=PyObjectId, alias="_id")
-    model_config = ConfigDict(populate_by_name=True, from_attributes=True, json_encoders={ObjectId: str})
+    id: IdField
+    model_config = ConfigDict(populate_by_name=True, from_attributes=True)
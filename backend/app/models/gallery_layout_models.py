@@ -1,11 +1,13 @@
 from pydantic import BaseModel, Field, ConfigDict
 from typing import List, Literal, Optional
-from bson import ObjectId
-from .main_models import PyObjectId
+from .main_models import IdField
 
 Mode = Literal['full', 'preview']
 
 class LayoutItem(BaseModel):
+    # Items are only read and re-serialized, never edited in place
+    model_config = ConfigDict(frozen=True)
+
     id: str
     x: int
     y: int
@@ -24,5 +26,5 @@ class GalleryLayoutCreate(GalleryLayoutBase):
     pass
 
 class GalleryLayoutInDB(GalleryLayoutBase):
-    id: PyObjectId = Field(default_factory=PyObjectId, alias="_id")
-    model_config = ConfigDict(populate_by_name=True, from_attributes=True, json_encoders={ObjectId: str})
\ No newline at end of file
+    id: IdField
+    model_config = ConfigDict(populate_by_name=True, from_attributes=True)
\ No newline at end of file
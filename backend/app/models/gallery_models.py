@@ -1,14 +1,20 @@
-from pydantic import BaseModel, Field, ConfigDict
-from bson import ObjectId
-from .main_models import PyObjectId
+from pydantic import BaseModel, ConfigDict
+from .main_models import IdField
 
 # --- Schema for Gallery Images ---
 # Defines the base structure for a gallery image.
 class GalleryImageBase(BaseModel):
+    # One class-level example instead of per-field example= kwargs
+    model_config = ConfigDict(json_schema_extra={"examples": [{
+        "src": "/api/gallery/files/2025-01-01_12-00-00_000000/photo.jpg",
+        "title": "Evening Aarti",
+        "category": "Rituals",
+    }]})
+
     # Source will be a backend-served URL (e.g., /api/gallery/files/<object_path>)
-    src: str = Field(..., example="/api/gallery/files/2025-01-01_12-00-00_000000/photo.jpg")
-    title: str = Field(..., example="Evening Aarti")
-    category: str = Field(..., example="Rituals")
+    src: str
+    title: str
+    category: str
 
 # Used when creating a new gallery image.
 class GalleryImageCreate(GalleryImageBase):
@@ -16,5 +22,5 @@ class GalleryImageCreate(GalleryImageBase):
 
 # Represents a gallery image object as stored in the database.
 class GalleryImageInDB(GalleryImageBase):
-    id: PyObjectId = Field(default_factory=PyObjectId, alias="_id")
-    model_config = ConfigDict(populate_by_name=True, from_attributes=True, json_encoders={ObjectId: str})
+    id: IdField
+    model_config = ConfigDict(populate_by_name=True, from_attributes=True)
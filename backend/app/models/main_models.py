@@ -1,8 +1,12 @@
-from typing import Any
+import re
+from typing import Annotated, Any, List, Optional
 from bson import ObjectId
 from pydantic_core import core_schema
 from pydantic.json_schema import JsonSchemaValue
-from pydantic import GetCoreSchemaHandler, GetJsonSchemaHandler
+from pydantic import Field, GetCoreSchemaHandler, GetJsonSchemaHandler
+
+# Matches the 24-hex-digit string form of an ObjectId
+_OBJECT_ID_MATCH = re.compile(r"\A[0-9a-fA-F]{24}\Z").match
 
 # --- Custom ObjectId Validator for Pydantic V2 ---
 # Ensures that MongoDB's ObjectId is correctly validated and
@@ -12,17 +16,17 @@ class PyObjectId(ObjectId):
     def __get_pydantic_core_schema__(
         cls, source_type: Any, handler: GetCoreSchemaHandler
     ) -> core_schema.CoreSchema:
-        def validate(value: str) -> ObjectId:
-            if not ObjectId.is_valid(value):
-                raise ValueError("Invalid ObjectId")
-            return ObjectId(value)
+        # One validator for both accepted inputs: ObjectId instances pass through,
+        # hex strings are checked once by the regex and parsed once by ObjectId
+        def validate(value: Any) -> ObjectId:
+            if isinstance(value, ObjectId):
+                return value
+            if isinstance(value, str) and _OBJECT_ID_MATCH(value):
+                return ObjectId(value)
+            raise ValueError("Invalid ObjectId")
 
-        instance_schema = core_schema.is_instance_schema(ObjectId)
-        string_schema = core_schema.chain_schema(
-            [core_schema.str_schema(), core_schema.no_info_plain_validator_function(validate)]
-        )
-        return core_schema.union_schema(
-            [instance_schema, string_schema],
+        return core_schema.no_info_plain_validator_function(
+            validate,
             serialization=core_schema.plain_serializer_function_ser_schema(str),
         )
 
@@ -31,3 +35,11 @@ class PyObjectId(ObjectId):
         cls, _core_schema: core_schema.CoreSchema, handler: GetJsonSchemaHandler
     ) -> JsonSchemaValue:
         return handler(core_schema.str_schema())
+
+
+# Shared `_id` field for the *InDB models, so every model reuses one annotated type.
+IdField = Annotated[PyObjectId, Field(default_factory=PyObjectId, alias="_id")]
+
+# Shared string-list fields (permissions, notification settings) for the admin models.
+StrList = Annotated[List[str], Field(default_factory=list)]
+OptStrList = Annotated[Optional[List[str]], Field(default=None)]
@@ -1,8 +1,12 @@
+import re
 from pydantic import BaseModel, Field, ConfigDict, field_validator
-from typing import Optional, List, Union
-from bson import ObjectId
-from .main_models import PyObjectId
-from datetime import date, datetime
+from typing import Annotated, Optional, List, Union
+from .main_models import IdField
+from datetime import date
+
+# Zero-padded YYYY-MM-DD; checked before date.fromisoformat, which on newer Pythons
+# also accepts other ISO 8601 forms (e.g. YYYYMMDD, week dates)
+_DATE_FORMAT = re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2}")
 
 # --- Schema for Required Stock Item ---
 # Defines the structure for a stock item required for a ritual.
@@ -28,26 +32,28 @@ class AvailableRitualBase(BaseModel):
     available_from: Optional[str] = Field(None, example="2023-01-01")
     available_to: Optional[str] = Field(None, example="2023-12-31")
 
+# Used when creating or updating an available ritual.
+class AvailableRitualCreate(AvailableRitualBase):
+    # Checked on writes only: stored rituals may still hold unpadded dates
+    # (e.g. 2023-1-5) that the earlier strptime check accepted
     @field_validator('available_from', 'available_to')
     @classmethod
     def validate_date_format(cls, v):
         """Validate that date strings are in YYYY-MM-DD format"""
         if v is not None:
+            if not _DATE_FORMAT.fullmatch(v):
+                raise ValueError('Date must be in YYYY-MM-DD format')
             try:
-                # Validate the date format
-                datetime.strptime(v, '%Y-%m-%d')
+                # Rejects impossible dates such as 2023-02-30
+                date.fromisoformat(v)
             except ValueError:
                 raise ValueError('Date must be in YYYY-MM-DD format')
         return v
 
-# Used when creating a new available ritual.
-class AvailableRitualCreate(AvailableRitualBase):
-    pass
-
 # Represents an available ritual object as stored in the database.
 class AvailableRitualInDB(AvailableRitualBase):
-    id: PyObjectId = Field(default_factory=PyObjectId, alias="_id")
-    model_config = ConfigDict(populate_by_name=True, from_attributes=True, json_encoders={ObjectId: str})
+    id: IdField
+    model_config = ConfigDict(populate_by_name=True, from_attributes=True)
 
 # --- Schema for a single Ritual instance in a booking ---
 # Defines the details of a specific ritual performed for a devotee.
@@ -59,3 +65,7 @@ class RitualInstance(BaseModel):
     dob: str = Field(...)
     subscription: str = Field(...)
     quantity: int = Field(...)
+
+# Ritual instances accepted on a new booking: at least one, capped so a single
+# public request cannot submit an unbounded list. Stored bookings are not re-checked.
+RitualInstances = Annotated[List[RitualInstance], Field(min_length=1, max_length=50)]
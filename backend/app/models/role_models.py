@@ -1,7 +1,6 @@
 from pydantic import BaseModel, Field, ConfigDict
 from typing import List
-from bson import ObjectId
-from .main_models import PyObjectId
+from .main_models import IdField
 
 
 class RoleBase(BaseModel):
@@ -11,5 +10,5 @@ class RoleBase(BaseModel):
 
 
 class RoleInDB(RoleBase):
-    id: PyObjectId = Field(default_factory=PyObjectId, alias="_id")
-    model_config = ConfigDict(populate_by_name=True, from_attributes=True, json_encoders={ObjectId: str})
+    id: IdField
+    model_config = ConfigDict(populate_by_name=True, from_attributes=True)
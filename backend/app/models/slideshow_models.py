@@ -1,7 +1,6 @@
 from pydantic import BaseModel, Field, ConfigDict
 from typing import List, Optional
-from bson import ObjectId
-from .main_models import PyObjectId
+from .main_models import IdField
 
 class SlideshowBase(BaseModel):
     image_ids: List[str] = Field(default_factory=list, description="Ordered list of gallery image IDs in slideshow")
@@ -13,5 +12,5 @@ class SlideshowCreate(SlideshowBase):
     pass
 
 class SlideshowInDB(SlideshowBase):
-    id: PyObjectId = Field(default_factory=PyObjectId, alias="_id")
-    model_config = ConfigDict(populate_by_name=True, from_attributes=True, json_encoders={ObjectId: str})
\ No newline at end of file
+    id: IdField
+    model_config = ConfigDict(populate_by_name=True, from_attributes=True)
\ No newline at end of file
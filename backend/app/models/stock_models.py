@@ -1,7 +1,6 @@
 from datetime import date, datetime
-from typing import Optional, Union
-from pydantic import BaseModel, Field, ConfigDict, field_validator
-from bson import ObjectId
+from typing import Annotated, Optional, Union
+from pydantic import BaseModel, BeforeValidator, Field, ConfigDict, field_validator
 
 class StockItemBase(BaseModel):
     name: str
@@ -77,25 +76,15 @@ class StockItemUpdate(BaseModel):
         return v
 
 class StockItemInDB(StockItemBase):
-    id: str = Field(alias="_id")
+    id: Annotated[str, BeforeValidator(str)] = Field(alias="_id")
 
+    # id is coerced to str by its annotation and pydantic already renders date/datetime as ISO 8601,
+    # so no legacy json_encoders are needed
     model_config = ConfigDict(
         populate_by_name=True,
         arbitrary_types_allowed=True,
-        json_encoders={
-            ObjectId: str,
-            date: lambda v: v.isoformat(),
-            datetime: lambda v: v.isoformat(),
-        },
     )
 
-    @field_validator("id", mode="before")
-    @classmethod
-    def _coerce_object_id(cls, v):
-        if isinstance(v, ObjectId):
-            return str(v)
-        return str(v)
-
     @field_validator('expiryDate', mode='before')
     @classmethod
     def validate_expiry_date(cls, v):
@@ -193,7 +193,6 @@ async def update_admin_user(
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Cannot assign super admin role")
 
     update_data = payload
-    update_data["updated_at"] = datetime.utcnow()
     update_data["updated_by"] = current_admin["username"]
 
     if "hashed_password" in update_data:
@@ -201,7 +200,8 @@ async def update_admin_user(
 
     updated_admin = await admins_collection.find_one_and_update(
         {"_id": ObjectId(user_id)},
-        {"$set": update_data},
+        # Let the server stamp updated_at so it follows the database clock
+        {"$set": update_data, "$currentDate": {"updated_at": {"$type": "date"}}},
         return_document=ReturnDocument.AFTER,
         projection={"hashed_password": 0},
     )
@@ -2,7 +2,7 @@ from fastapi import APIRouter, HTTPException, Depends, Request, Response
 import os
 import re
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import Dict, Any, Optional
 from datetime import datetime, timedelta
 import logging
@@ -59,6 +59,8 @@ async def handle_cors_preflight(request: Request):
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
 
 class TokenResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     access_token: str
     token_type: str = "bearer"
     expires_in: int
@@ -49,12 +49,12 @@ async def update_my_profile(
     if not update_data:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="No update data provided")
 
-    update_data["updated_at"] = datetime.utcnow()
     update_data["updated_by"] = current_admin.get("username", "system")
 
     updated_admin = await admins_collection.find_one_and_update(
         {"_id": ObjectId(user_id)},
-        {"$set": update_data},
+        # Let the server stamp updated_at so it follows the database clock
+        {"$set": update_data, "$currentDate": {"updated_at": {"$type": "date"}}},
         return_document=ReturnDocument.AFTER
     )
 
@@ -9,9 +9,11 @@ async def create_activity(activity: ActivityCreate) -> ActivityInDB:
     Create a new activity record.
     """
     activity_data = activity.model_dump()
-    result = await activities_collection.insert_one(activity_data)
-    new_activity = await activities_collection.find_one({"_id": result.inserted_id})
-    return ActivityInDB(**new_activity)
+    # insert_one stamps the generated _id onto activity_data, so there is no
+    # need to read the document back from the database; the data was just
+    # validated by ActivityCreate, so construct without re-validating
+    await activities_collection.insert_one(activity_data)
+    return ActivityInDB.model_construct(**activity_data)
 
 async def get_all_activities(
     role: Optional[str] = None,
@@ -33,4 +35,6 @@ async def get_all_activities(
         query["timestamp"] = {"$gte": start, "$lte": end}
 
     activities = await activities_collection.find(query).sort("timestamp", -1).to_list(1000)
-    return [ActivityInDB(**activity) for activity in activities]
\ No newline at end of file
+    # Activities are only ever written through create_activity from a validated
+    # ActivityCreate, so stored documents are trusted and not re-validated here
+    return [ActivityInDB.model_construct(**activity) for activity in activities]
\ No newline at end of file
@@ -1,5 +1,7 @@
 from fastapi import HTTPException, status
 from bson import ObjectId
+from pymongo import UpdateOne
+from .stock_analytics_service import invalidate_stock_analytics_cache
 from ..database import bookings_collection, available_rituals_collection, stock_collection
 from ..models import BookingCreate
 
@@ -10,6 +12,7 @@ async def create_booking(booking: BookingCreate):
     Raises HTTPException if stock is insufficient or a required stock item is not found.
     """
     # 1. Pre-check stock availability before creating the booking document
+    rituals = {}
     for instance in booking.instances:
         if not ObjectId.is_valid(instance.ritualId):
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Invalid Ritual ID: {instance.ritualId}")
@@ -18,6 +21,7 @@ async def create_booking(booking: BookingCreate):
         
         if not ritual:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Ritual with ID {instance.ritualId} not found.")
+        rituals[instance.ritualId] = ritual
 
         if ritual.get("required_stock"):
             for req_stock in ritual["required_stock"]:
@@ -45,16 +49,24 @@ async def create_booking(booking: BookingCreate):
     result = await bookings_collection.insert_one(booking_data)
     new_booking = await bookings_collection.find_one({"_id": result.inserted_id})
 
-    # 3. After successful booking, deduct the stock
+    # 3. After successful booking, deduct the stock. Rituals were already loaded
+    # in step 1; totals are summed per stock item and applied in one round trip.
+    deductions = {}
     for instance in booking.instances:
-        ritual = await available_rituals_collection.find_one({"_id": ObjectId(instance.ritualId)})
-        if ritual and ritual.get("required_stock"):
-            for req_stock in ritual["required_stock"]:
-                quantity_to_deduct = req_stock["quantity_required"] * instance.quantity
-                await stock_collection.update_one(
-                    {"_id": ObjectId(req_stock["stock_item_id"])},
-                    {"$inc": {"quantity": -quantity_to_deduct}}
-                )
+        ritual = rituals[instance.ritualId]
+        for req_stock in ritual.get("required_stock") or []:
+            stock_item_id = req_stock["stock_item_id"]
+            quantity_to_deduct = req_stock["quantity_required"] * instance.quantity
+            deductions[stock_item_id] = deductions.get(stock_item_id, 0) + quantity_to_deduct
+    if deductions:
+        await stock_collection.bulk_write(
+            [
+                UpdateOne({"_id": ObjectId(item_id)}, {"$inc": {"quantity": -quantity}})
+                for item_id, quantity in deductions.items()
+            ],
+            ordered=False,
+        )
+        invalidate_stock_analytics_cache()
 
     return new_booking
 
@@ -2,6 +2,8 @@ from ..database import employee_bookings_collection, available_rituals_collectio
 from ..models.employee_booking_models import EmployeeBookingCreate
 from fastapi import HTTPException, status
 from bson import ObjectId
+from pymongo import UpdateOne
+from .stock_analytics_service import invalidate_stock_analytics_cache
 
 async def create_employee_booking(booking: EmployeeBookingCreate):
     """
@@ -31,12 +33,16 @@ async def create_employee_booking(booking: EmployeeBookingCreate):
                 detail=f"Insufficient stock for {item_name}. Required: {required_qty}, Available: {stock_item.get('quantity', 0) if stock_item else 0}"
             )
 
-    # 3. Deduct stock
-    for item_id, required_qty in total_required_stock.items():
-        await stock_collection.update_one(
-            {"_id": ObjectId(item_id)},
-            {"$inc": {"quantity": -required_qty}}
+    # 3. Deduct stock in a single round trip
+    if total_required_stock:
+        await stock_collection.bulk_write(
+            [
+                UpdateOne({"_id": ObjectId(item_id)}, {"$inc": {"quantity": -required_qty}})
+                for item_id, required_qty in total_required_stock.items()
+            ],
+            ordered=False,
         )
+        invalidate_stock_analytics_cache()
 
     # 4. Create the booking in the correct collection
     booking_data = booking.model_dump()
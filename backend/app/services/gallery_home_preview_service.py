@@ -21,10 +21,8 @@ async def get_home_preview() -> Optional[dict]:
 
 async def save_home_preview(payload: HomePreviewCreate) -> dict:
     data = payload.model_dump()
-    # Normalize to exactly 6 slots
-    slots = (data.get("slots") or [])[:6]
-    slots = slots + [None] * (6 - len(slots))
-    data["slots"] = slots
+    # The model already guarantees exactly 6 slots; store them as a BSON array
+    data["slots"] = list(data["slots"])
     await gallery_home_preview_collection.update_one({}, {"$set": data}, upsert=True)
     doc = await gallery_home_preview_collection.find_one({})
     return doc
@@ -101,19 +101,26 @@ class JWTSecurityService:
     
     def get_client_info(self, request: Request) -> Dict[str, str]:
         """Extract client information for token binding. If behind a proxy and TRUST_PROXY is true,
-        prefer X-Forwarded-For header's first IP."""
+        prefer X-Forwarded-For header's first IP. The result is cached on request.state
+        so the middleware and route handlers parse the headers only once per request."""
+        cached = getattr(request.state, "client_info", None)
+        if cached is not None:
+            return cached
         ip = ""
         if self.trust_proxy:
             xff = request.headers.get("x-forwarded-for") or request.headers.get("X-Forwarded-For")
             if xff:
-                # Take the first IP in the list
-                ip = xff.split(",")[0].strip()
+                # Take the first IP in the list; partition stops at the first comma
+                # instead of splitting the whole (client-controlled) chain
+                ip = xff.partition(",")[0].strip()
         if not ip:
             ip = request.client.host if request.client else ""
-        return {
+        client_info = {
             "ip": ip,
             "user_agent": request.headers.get("user-agent", "")
         }
+        request.state.client_info = client_info
+        return client_info
     
     def refresh_access_token(self, refresh_token: str, client_info: Optional[Dict[str, str]] = None) -> str:
         """Generate new access token using refresh token"""
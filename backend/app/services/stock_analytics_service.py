@@ -1,10 +1,42 @@
-from typing import Any, Dict, List, Literal
+import time
+from typing import Any, Dict, List, Literal, Tuple
 from datetime import datetime
 from ..database import stock_collection
 
 Period = Literal["monthly", "yearly", "category"]
 AnalyticsPeriod = Literal["monthly", "yearly"]
 
+# Short-lived in-memory cache of aggregation results keyed by (period, year).
+# Stock writes clear it; the TTL bounds staleness from anything that doesn't.
+# The generation is bumped on every invalidation so an aggregation that was
+# already running when stock changed does not store its stale result.
+_ANALYTICS_TTL_SECONDS = 30
+_analytics_cache: Dict[Tuple[str, int], Tuple[float, List[Dict[str, Any]]]] = {}
+_analytics_generation = 0
+
+
+def invalidate_stock_analytics_cache():
+    """Drops all cached analytics; call after any change to stock quantities or prices."""
+    global _analytics_generation
+    _analytics_generation += 1
+    _analytics_cache.clear()
+
+
+async def _cached(key: Tuple[str, int], compute) -> List[Dict[str, Any]]:
+    now = time.monotonic()
+    # Evict expired entries so keys that are never requested again (year is a
+    # free query parameter) do not accumulate
+    for stale_key in [k for k, (ts, _) in _analytics_cache.items() if now - ts >= _ANALYTICS_TTL_SECONDS]:
+        del _analytics_cache[stale_key]
+    cached = _analytics_cache.get(key)
+    if cached:
+        return cached[1]
+    generation = _analytics_generation
+    result = await compute()
+    if generation == _analytics_generation:
+        _analytics_cache[key] = (now, result)
+    return result
+
 async def _get_stock_analytics_data(period: AnalyticsPeriod, year: int) -> List[Dict[str, Any]]:
     """Runs a MongoDB aggregation to get stock analytics by month or year."""
     group_id = {"year": {"$year": "$addedOn"}}
@@ -81,12 +113,12 @@ async def get_stock_analytics_service(period: Period, year: int) -> List[Dict[st
     Delegates to the appropriate aggregation logic.
     """
     if period == "category":
-        return await _get_stock_analytics_by_category(year)
-    return await _get_stock_analytics_data(period, year)
+        return await _cached(("category", year), lambda: _get_stock_analytics_by_category(year))
+    return await _cached((period, year), lambda: _get_stock_analytics_data(period, year))
 
 async def get_stock_category_analytics_service(year: int) -> List[Dict[str, Any]]:
     """
     Explicit category analytics for consumers that prefer a dedicated method.
     """
-    return await _get_stock_analytics_by_category(year)
+    return await _cached(("category", year), lambda: _get_stock_analytics_by_category(year))
 
@@ -4,6 +4,7 @@ from datetime import datetime, date
 
 from ..models.stock_models import StockItemCreate, StockItemUpdate, StockItemInDB
 from ..database import stock_collection
+from .stock_analytics_service import invalidate_stock_analytics_cache
 
 def _stock_item_helper(item) -> StockItemInDB:
     """Converts a MongoDB document to a Pydantic model, ensuring _id is a string."""
@@ -27,6 +28,7 @@ async def create_stock_item_service(data: StockItemCreate) -> StockItemInDB:
         item_dict["addedOn"] = datetime.combine(item_dict["addedOn"], datetime.min.time())
 
     result = await stock_collection.insert_one(item_dict)
+    invalidate_stock_analytics_cache()
     new_item = await stock_collection.find_one({"_id": result.inserted_id})
     return _stock_item_helper(new_item)
 
@@ -57,6 +59,7 @@ async def update_stock_item_service(item_id: str, data: StockItemUpdate) -> Opti
         {"$set": update_data},
         return_document=True
     )
+    invalidate_stock_analytics_cache()
     return _stock_item_helper(updated_item) if updated_item else None
 
 async def delete_stock_item_service(item_id: str) -> bool:
@@ -65,5 +68,6 @@ async def delete_stock_item_service(item_id: str) -> bool:
         raise ValueError("Invalid ObjectId format")
         
     result = await stock_collection.delete_one({"_id": ObjectId(item_id)})
+    invalidate_stock_analytics_cache()
     return result.deleted_count > 0
 